@@ -3,42 +3,64 @@ Configuration management module
 Manages environment variables and application configuration
 """
 import os
+import sys
+from dataclasses import dataclass, field
+from types import MappingProxyType
+from typing import Mapping, Optional
 from dotenv import load_dotenv
 
 # Load environment variables
 load_dotenv()
 
 
+@dataclass(frozen=True, slots=True)
 class Settings:
     """Application configuration class"""
-    
-    def __init__(self):
-        self.openai_api_key = os.getenv("OPENAI_API_KEY")
-        self.public_url = os.getenv("PUBLIC_URL", "")
-        self.port = int(os.getenv("PORT", "8081"))
-        self.openai_model = "gpt-4o-realtime-preview-2024-12-17"
-        self.openai_ws_url = "wss://api.openai.com/v1/realtime"
-        
+
+    openai_api_key: Optional[str] = field(repr=False)
+    public_url: str
+    port: int = 8081
+    openai_model: str = "gpt-4o-realtime-preview-2024-12-17"
+    openai_ws_url: str = "wss://api.openai.com/v1/realtime"
+    # Development mode: enables auto-reload (single worker)
+    debug: bool = False
+    # Uvicorn worker processes; call sessions and the logs frontend are per-process state
+    workers: int = 1
+
+    # Derived values, computed once in __post_init__
+    openai_headers: Mapping[str, str] = field(init=False, repr=False)
+    openai_realtime_url: str = field(init=False)
+
+    def __post_init__(self):
         # Validate required environment variables
         if not self.openai_api_key:
             raise ValueError("OPENAI_API_KEY environment variable is required")
-        
+
         if not self.public_url:
             raise ValueError("PUBLIC_URL environment variable is required")
-    
-    @property
-    def openai_headers(self) -> dict:
-        """Get OpenAI WebSocket connection headers"""
-        return {
+
+        # OpenAI WebSocket connection headers (read-only, shared across connections)
+        object.__setattr__(self, "openai_headers", MappingProxyType({
             "Authorization": f"Bearer {self.openai_api_key}",
             "OpenAI-Beta": "realtime=v1"
-        }
-    
-    @property
-    def openai_realtime_url(self) -> str:
-        """Get complete OpenAI Realtime API URL"""
-        return f"{self.openai_ws_url}?model={self.openai_model}"
+        }))
+        # Complete OpenAI Realtime API URL
+        object.__setattr__(self, "openai_realtime_url", f"{self.openai_ws_url}?model={self.openai_model}")
+
+    @classmethod
+    def from_env(cls) -> "Settings":
+        """Create settings from environment variables"""
+        return cls(
+            openai_api_key=os.getenv("OPENAI_API_KEY"),
+            public_url=os.getenv("PUBLIC_URL", ""),
+            port=int(os.getenv("PORT", "8081")),
+            debug=os.getenv("DEBUG", "").lower() in ("1", "true", "yes"),
+            workers=int(os.getenv("WORKERS", "1")),
+        )
+
 
+# Event loop for uvicorn: libuv-based uvloop where available (not supported on Windows)
+UVICORN_LOOP = "asyncio" if sys.platform == "win32" else "uvloop"
 
 # Global configuration instance
-settings = Settings()
+settings = Settings.from_env()
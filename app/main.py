@@ -3,18 +3,19 @@ FastAPI main application
 Provides HTTP API endpoints and WebSocket connection handling
 """
 import logging
+import time
 from urllib.parse import urlparse
 from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
 from fastapi import FastAPI, Request, WebSocket, HTTPException
-from fastapi.responses import Response
+from fastapi.responses import JSONResponse, Response
 from fastapi.middleware.cors import CORSMiddleware
 
-from app.config import settings
+from app.config import settings, UVICORN_LOOP
 from app.models.schemas import PublicUrlResponse, ToolsResponse
-from app.services.function_handlers import function_handler_service
-from app.websocket.handlers import websocket_handler
-from app.utils.health_check import health_checker
-from app.utils.error_handler import error_collector
+
+# Service modules (aiohttp, websockets, psutil) are imported inside the endpoints
+# that use them to keep application import time low
 
 # Configure logging
 logging.basicConfig(
@@ -55,6 +56,29 @@ except FileNotFoundError:
   <Say>Disconnected</Say>
 </Response>"""
 
+# Render TwiML once; PUBLIC_URL is fixed for the lifetime of the process
+_PARSED_PUBLIC_URL = urlparse(settings.public_url)
+_WS_URL = f"wss://{_PARSED_PUBLIC_URL.netloc}/ws/call"
+_TWIML_BYTES = TWIML_TEMPLATE.replace("{{WS_URL}}", _WS_URL).encode("utf-8")
+
+
+class _PrerenderedResponse(Response):
+    """Response with a pre-encoded body and pre-built raw headers"""
+
+    def __init__(self, body: bytes, raw_headers: List[Tuple[bytes, bytes]]):
+        self.status_code = 200
+        self.background = None
+        self.body = body
+        # Copy the header list since middleware may append to it in place
+        self.raw_headers = list(raw_headers)
+
+
+_TWIML_RAW_HEADERS = Response(content=_TWIML_BYTES, media_type="application/xml").raw_headers
+
+# Aggregated health report cache: (monotonic time computed, report)
+HEALTH_CACHE_TTL = 2.0
+_health_cache: Optional[Tuple[float, Dict[str, Any]]] = None
+
 
 @app.get("/")
 async def root():
@@ -89,21 +113,7 @@ async def handle_twiml(request: Request):
     Returns:
         TwiML XML response
     """
-    try:
-        # Build WebSocket URL
-        parsed_url = urlparse(settings.public_url)
-        ws_url = f"wss://{parsed_url.netloc}/ws/call"
-
-        # Replace placeholders in template
-        twiml_content = TWIML_TEMPLATE.replace("{{WS_URL}}", ws_url)
-
-        return Response(
-            content=twiml_content,
-            media_type="application/xml"
-        )
-    except Exception as e:
-        logger.error(f"Error generating TwiML: {e}")
-        raise HTTPException(status_code=500, detail="Internal server error")
+    return _PrerenderedResponse(_TWIML_BYTES, _TWIML_RAW_HEADERS)
 
 
 @app.get("/tools", response_model=ToolsResponse)
@@ -114,14 +124,63 @@ async def get_tools():
     Returns:
         ToolsResponse: Response containing list of tool schemas
     """
+    from app.services.function_handlers import function_handler_service
+
     try:
-        schemas = function_handler_service.get_function_schemas()
-        return ToolsResponse(tools=schemas)
+        # Serve cached JSON directly; schemas are registered once at startup
+        return Response(
+            content=function_handler_service.get_tools_json(),
+            media_type="application/json"
+        )
     except Exception as e:
         logger.error(f"Error getting tools: {e}")
         raise HTTPException(status_code=500, detail="Internal server error")
 
 
+async def _get_health_report() -> Dict[str, Any]:
+    """
+    Run all health checks, reusing the last report for HEALTH_CACHE_TTL seconds
+    
+    Returns:
+        Aggregated health status information
+    """
+    global _health_cache
+
+    if _health_cache is not None and time.monotonic() - _health_cache[0] < HEALTH_CACHE_TTL:
+        return _health_cache[1]
+
+    from app.utils.health_check import health_checker
+    from app.utils.error_handler import error_collector
+
+    health_results = await health_checker.run_all_checks()
+
+    # Calculate overall status
+    overall_status = "healthy"
+    for result in health_results:
+        if result.status == "critical":
+            overall_status = "critical"
+            break
+        elif result.status == "warning" and overall_status == "healthy":
+            overall_status = "warning"
+
+    report = {
+        "status": overall_status,
+        "timestamp": health_results[0].timestamp.isoformat() if health_results else None,
+        "services": [
+            {
+                "service": result.service,
+                "status": result.status,
+                "message": result.message,
+                "details": result.details
+            }
+            for result in health_results
+        ],
+        "errors": error_collector.get_error_summary()
+    }
+    _health_cache = (time.monotonic(), report)
+    return report
+
+
 @app.get("/health")
 async def health_check():
     """
@@ -131,31 +190,7 @@ async def health_check():
         Health status information
     """
     try:
-        health_results = await health_checker.run_all_checks()
-
-        # Calculate overall status
-        overall_status = "healthy"
-        for result in health_results:
-            if result.status == "critical":
-                overall_status = "critical"
-                break
-            elif result.status == "warning" and overall_status == "healthy":
-                overall_status = "warning"
-
-        return {
-            "status": overall_status,
-            "timestamp": health_results[0].timestamp.isoformat() if health_results else None,
-            "services": [
-                {
-                    "service": result.service,
-                    "status": result.status,
-                    "message": result.message,
-                    "details": result.details
-                }
-                for result in health_results
-            ],
-            "errors": error_collector.get_error_summary()
-        }
+        return await _get_health_report()
     except Exception as e:
         logger.error(f"Health check failed: {e}")
         return {
@@ -164,6 +199,38 @@ async def health_check():
         }
 
 
+@app.get("/live")
+async def liveness_check():
+    """
+    Liveness probe endpoint, does not run any health checks
+    
+    Returns:
+        Static OK status
+    """
+    return {"status": "ok"}
+
+
+@app.get("/ready")
+async def readiness_check():
+    """
+    Readiness probe endpoint
+    
+    Returns:
+        Health status information, with status code 503 when critical
+    """
+    try:
+        report = await _get_health_report()
+    except Exception as e:
+        logger.error(f"Readiness check failed: {e}")
+        report = {
+            "status": "critical",
+            "message": f"Readiness check failed: {str(e)}"
+        }
+
+    status_code = 503 if report["status"] == "critical" else 200
+    return JSONResponse(content=report, status_code=status_code)
+
+
 @app.websocket("/ws/call")
 async def websocket_call_endpoint(websocket: WebSocket):
     """
@@ -172,7 +239,9 @@ async def websocket_call_endpoint(websocket: WebSocket):
     Args:
         websocket: WebSocket connection
     """
-    await websocket_handler.handle_call_connection(websocket)
+    from app.websocket.handlers import handle_call_connection
+
+    await handle_call_connection(websocket)
 
 
 @app.websocket("/ws/logs")
@@ -183,7 +252,9 @@ async def websocket_logs_endpoint(websocket: WebSocket):
     Args:
         websocket: WebSocket connection
     """
-    await websocket_handler.handle_logs_connection(websocket)
+    from app.websocket.handlers import handle_logs_connection
+
+    await handle_logs_connection(websocket)
 
 
 @app.on_event("startup")
@@ -193,6 +264,11 @@ async def startup_event():
     logger.info(f"Public URL: {settings.public_url}")
     logger.info(f"Port: {settings.port}")
     logger.info(f"OpenAI Model: {settings.openai_model}")
+
+    # Functions are registered at import time; freeze so /tools serves precomputed JSON
+    from app.services.function_handlers import function_handler_service
+    function_handler_service.freeze()
+
     logger.info("=== Server Ready ===")
 
 
@@ -201,6 +277,12 @@ async def shutdown_event():
     """Application shutdown event"""
     logger.info("=== Server Shutting Down ===")
 
+    from app.services.session_manager import session_manager
+    await session_manager.disconnect_all()
+
+    from app.services.function_handlers import function_handler_service
+    await function_handler_service.close()
+
 
 if __name__ == "__main__":
     import uvicorn
@@ -209,6 +291,9 @@ if __name__ == "__main__":
         "app.main:app",
         host="0.0.0.0",
         port=settings.port,
-        reload=True,
+        reload=settings.debug,
+        workers=1 if settings.debug else settings.workers,
+        loop=UVICORN_LOOP,
+        http="httptools",
         log_level="info"
     )
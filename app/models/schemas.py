@@ -2,8 +2,9 @@
 Data models and schema definitions
 Define all data structures using Pydantic
 """
-from typing import Optional, Dict, Any, List
-from pydantic import BaseModel
+from types import MappingProxyType
+from typing import Optional, Dict, Any, List, Union
+from pydantic import BaseModel, ConfigDict, Field
 from enum import Enum
 
 
@@ -49,18 +50,30 @@ class TwilioCloseMessage(BaseModel):
     streamSid: str
 
 
+# Read-only session defaults shared by all OpenAISessionConfig instances
+_DEFAULT_MODALITIES = ("text", "audio")
+_DEFAULT_TURN_DETECTION = MappingProxyType({"type": "server_vad"})
+_DEFAULT_INPUT_AUDIO_TRANSCRIPTION = MappingProxyType({"model": "whisper-1"})
+
+
 class OpenAISessionConfig(BaseModel):
     """OpenAI session configuration"""
-    modalities: List[str] = ["text", "audio"]
-    turn_detection: Dict[str, str] = {"type": "server_vad"}
+    model_config = ConfigDict(frozen=True)
+
+    modalities: List[str] = Field(default_factory=lambda: list(_DEFAULT_MODALITIES))
+    turn_detection: Dict[str, str] = Field(default_factory=lambda: dict(_DEFAULT_TURN_DETECTION))
     voice: str = "ash"
-    input_audio_transcription: Dict[str, str] = {"model": "whisper-1"}
+    input_audio_transcription: Dict[str, str] = Field(
+        default_factory=lambda: dict(_DEFAULT_INPUT_AUDIO_TRANSCRIPTION)
+    )
     input_audio_format: str = "g711_ulaw"
     output_audio_format: str = "g711_ulaw"
 
 
 class OpenAISessionUpdate(BaseModel):
     """OpenAI session update message"""
+    model_config = ConfigDict(frozen=True)
+
     type: str = "session.update"
     session: OpenAISessionConfig
 
@@ -93,8 +106,9 @@ class FunctionHandler(BaseModel):
 class SessionState(BaseModel):
     """Session state"""
     stream_sid: Optional[str] = None
-    latest_media_timestamp: Optional[int] = None
-    response_start_timestamp: Optional[int] = None
+    # Raw Twilio media timestamps (may be numeric strings), converted on use
+    latest_media_timestamp: Optional[Union[int, str]] = None
+    response_start_timestamp: Optional[Union[int, str]] = None
     last_assistant_item: Optional[str] = None
     saved_config: Optional[Dict[str, Any]] = None
 
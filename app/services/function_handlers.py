@@ -3,17 +3,33 @@ Function handler service
 Define OpenAI callable functions and their processing logic
 """
 import json
+import time
+import asyncio
 import aiohttp
-from typing import Dict, Any, List, Callable, Awaitable
+import orjson
+from typing import Dict, Any, List, Callable, Awaitable, Optional, Sequence, Tuple
 from app.models.schemas import FunctionSchema, FunctionHandler
 
+# Weather responses are cached per rounded coordinate (~1km) for a few minutes
+WEATHER_CACHE_TTL = 300.0
+WEATHER_CACHE_MAXSIZE = 512
+
 
 class FunctionHandlerService:
     """Function handler service class"""
     
     def __init__(self):
         self.handlers: Dict[str, Callable[[Dict[str, Any]], Awaitable[str]]] = {}
-        self.schemas: List[FunctionSchema] = []
+        self.schemas: Sequence[FunctionSchema] = []
+        self._frozen = False
+        # Serialized schema caches, rebuilt lazily after registration changes
+        self._schemas_cache: Optional[List[Dict[str, Any]]] = None
+        self._tools_json_cache: Optional[bytes] = None
+        # Shared HTTP session, created lazily inside the running event loop
+        self._http_session: Optional[aiohttp.ClientSession] = None
+        # Weather cache: key -> (expiry monotonic time, JSON result)
+        self._weather_cache: Dict[Tuple[float, float], Tuple[float, str]] = {}
+        self._weather_locks: Dict[Tuple[float, float], asyncio.Lock] = {}
         self._register_default_functions()
     
     def _register_default_functions(self):
@@ -54,6 +70,9 @@ class FunctionHandlerService:
             parameters: Function parameter schema
             handler: Function handler
         """
+        if self._frozen:
+            raise RuntimeError(f"Cannot register function {name}: function registry is frozen")
+        
         schema = FunctionSchema(
             name=name,
             description=description,
@@ -62,6 +81,8 @@ class FunctionHandlerService:
         
         self.schemas.append(schema)
         self.handlers[name] = handler
+        self._schemas_cache = None
+        self._tools_json_cache = None
     
     async def handle_function_call(self, name: str, arguments: str) -> str:
         """
@@ -74,29 +95,67 @@ class FunctionHandlerService:
         Returns:
             JSON string of function execution result
         """
-        if name not in self.handlers:
-            return json.dumps({
+        handler = self.handlers.get(name)
+        if handler is None:
+            return orjson.dumps({
                 "error": f"No handler found for function: {name}"
-            })
+            }).decode("utf-8")
         
-        try:
-            args = json.loads(arguments)
-        except json.JSONDecodeError:
-            return json.dumps({
-                "error": "Invalid JSON arguments for function call"
-            })
+        # No-argument tools commonly send an empty object; skip the decoder
+        if not arguments or arguments == "{}" or arguments.isspace():
+            args = {}
+        else:
+            try:
+                args = orjson.loads(arguments)
+            except orjson.JSONDecodeError:
+                return orjson.dumps({
+                    "error": "Invalid JSON arguments for function call"
+                }).decode("utf-8")
         
         try:
-            result = await self.handlers[name](args)
+            result = await handler(args)
             return result
         except Exception as e:
-            return json.dumps({
+            return orjson.dumps({
                 "error": f"Error running function {name}: {str(e)}"
-            })
+            }).decode("utf-8")
+    
+    async def close(self):
+        """Close the shared HTTP session"""
+        if self._http_session and not self._http_session.closed:
+            await self._http_session.close()
+        self._http_session = None
+
+    def _get_http_session(self) -> aiohttp.ClientSession:
+        """Get the shared HTTP session, creating it on first use"""
+        # No await between check and assignment, so no lock is needed
+        if self._http_session is None or self._http_session.closed:
+            self._http_session = aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(limit=32, ttl_dns_cache=300, keepalive_timeout=60),
+                timeout=aiohttp.ClientTimeout(total=5)
+            )
+        return self._http_session
+
+    def freeze(self):
+        """Freeze the function registry and precompute serialized schemas"""
+        if self._frozen:
+            return
+        
+        self.schemas = tuple(self.schemas)
+        self._frozen = True
+        self.get_tools_json()
     
     def get_function_schemas(self) -> List[Dict[str, Any]]:
         """Get schema list of all functions"""
-        return [function_schema.dict() for function_schema in self.schemas]
+        if self._schemas_cache is None:
+            self._schemas_cache = [function_schema.model_dump() for function_schema in self.schemas]
+        return self._schemas_cache
+
+    def get_tools_json(self) -> bytes:
+        """Get pre-serialized JSON body for the tools list response"""
+        if self._tools_json_cache is None:
+            self._tools_json_cache = orjson.dumps({"tools": self.get_function_schemas()})
+        return self._tools_json_cache
     
     async def _get_weather_handler(self, args: Dict[str, Any]) -> str:
         """Weather query function handler"""
@@ -108,6 +167,61 @@ class FunctionHandlerService:
                 "error": "Missing latitude or longitude"
             })
         
+        try:
+            key = (round(float(latitude), 2), round(float(longitude), 2))
+        except (TypeError, ValueError):
+            return json.dumps({
+                "error": "Invalid latitude or longitude"
+            })
+        
+        cached = self._get_cached_weather(key)
+        if cached is not None:
+            return cached
+        
+        # Coalesce concurrent lookups for the same coordinates into one request
+        lock = self._weather_locks.setdefault(key, asyncio.Lock())
+        try:
+            async with lock:
+                cached = self._get_cached_weather(key)
+                if cached is not None:
+                    return cached
+                
+                result, ok = await self._fetch_weather(latitude, longitude)
+                if ok:
+                    self._store_cached_weather(key, result)
+                return result
+        finally:
+            if not lock.locked():
+                self._weather_locks.pop(key, None)
+    
+    def _get_cached_weather(self, key: Tuple[float, float]) -> Optional[str]:
+        """Get cached weather result if it has not expired"""
+        entry = self._weather_cache.get(key)
+        if entry is None:
+            return None
+        if entry[0] <= time.monotonic():
+            self._weather_cache.pop(key, None)
+            return None
+        return entry[1]
+    
+    def _store_cached_weather(self, key: Tuple[float, float], result: str):
+        """Store weather result, evicting expired or oldest entries when full"""
+        now = time.monotonic()
+        if len(self._weather_cache) >= WEATHER_CACHE_MAXSIZE:
+            expired = [k for k, (expiry, _) in self._weather_cache.items() if expiry <= now]
+            for k in expired:
+                del self._weather_cache[k]
+            if len(self._weather_cache) >= WEATHER_CACHE_MAXSIZE:
+                del self._weather_cache[next(iter(self._weather_cache))]
+        self._weather_cache[key] = (now + WEATHER_CACHE_TTL, result)
+    
+    async def _fetch_weather(self, latitude: Any, longitude: Any) -> Tuple[str, bool]:
+        """
+        Fetch current weather from open-meteo
+        
+        Returns:
+            Tuple of (JSON string result, whether the lookup succeeded)
+        """
         try:
             url = (
                 f"https://api.open-meteo.com/v1/forecast"
@@ -116,20 +230,19 @@ class FunctionHandlerService:
                 f"&hourly=temperature_2m,relative_humidity_2m,wind_speed_10m"
             )
             
-            async with aiohttp.ClientSession() as session:
-                async with session.get(url) as response:
-                    if response.status == 200:
-                        data = await response.json()
-                        current_temp = data.get("current", {}).get("temperature_2m")
-                        return json.dumps({"temp": current_temp})
-                    else:
-                        return json.dumps({
-                            "error": f"Weather API returned status {response.status}"
-                        })
+            async with self._get_http_session().get(url) as response:
+                if response.status == 200:
+                    data = await response.json()
+                    current_temp = data.get("current", {}).get("temperature_2m")
+                    return json.dumps({"temp": current_temp}), True
+                else:
+                    return json.dumps({
+                        "error": f"Weather API returned status {response.status}"
+                    }), False
         except Exception as e:
             return json.dumps({
                 "error": f"Failed to fetch weather data: {str(e)}"
-            })
+            }), False
 
 
 # Global function handler instance
@@ -2,10 +2,11 @@
 OpenAI client service
 Manages WebSocket connection to OpenAI Realtime API with auto-reconnect functionality
 """
-import json
 import asyncio
 import logging
-from typing import Optional, Callable, Awaitable, Dict, Any
+import random
+from typing import Optional, Callable, Awaitable, Dict, Any, Tuple, Union
+import orjson
 import websockets
 from websockets.exceptions import ConnectionClosed, WebSocketException
 
@@ -14,6 +15,15 @@ from app.models.schemas import OpenAISessionUpdate, OpenAISessionConfig
 
 logger = logging.getLogger(__name__)
 
+# Message handlers receive the parsed message and the raw frame it was parsed from
+MessageHandler = Callable[[Dict[str, Any], Union[str, bytes]], Awaitable[None]]
+
+# Maximum number of outbound frames buffered before send_message applies backpressure
+SEND_QUEUE_MAXSIZE = 256
+
+# Default session configuration, dumped once and merged with user configuration per connect
+_DEFAULT_SESSION_DATA: Dict[str, Any] = OpenAISessionConfig().model_dump()
+
 
 class OpenAIClient:
     """OpenAI Realtime API client with auto-reconnect support"""
@@ -21,8 +31,16 @@ class OpenAIClient:
     def __init__(self):
         self.websocket: Optional[websockets.WebSocketClientProtocol] = None
         self.is_connected = False
-        self.message_handler: Optional[Callable[[Dict[str, Any]], Awaitable[None]]] = None
+        self.message_handler: Optional[MessageHandler] = None
         self.session_config: Optional[Dict[str, Any]] = None
+        self._listen_task: Optional[asyncio.Task] = None
+        # Outbound frames are written by a single writer task per connection
+        self._send_queue: Optional[asyncio.Queue] = None
+        # Set when the writer for the current queue stops, releasing senders blocked on it
+        self._send_closed: Optional[asyncio.Event] = None
+        self._writer_task: Optional[asyncio.Task] = None
+        # Serialized session.update frame, rebuilt when the session config changes
+        self._session_update_frame: Optional[str] = None
         
         # Reconnect configuration
         self.auto_reconnect = True
@@ -31,6 +49,7 @@ class OpenAIClient:
         self.max_reconnect_delay = 30.0  # Maximum reconnect delay (seconds)
         self.current_reconnect_attempts = 0
         self.reconnect_task: Optional[asyncio.Task] = None
+        self._delay_schedule: Tuple[float, ...] = self._build_delay_schedule()
         
         # Connection state callbacks
         self.on_connected: Optional[Callable[[], Awaitable[None]]] = None
@@ -57,8 +76,9 @@ class OpenAIClient:
             self.current_reconnect_attempts = 0  # Reset reconnect counter
             logger.info("Successfully connected to OpenAI Realtime API")
             
-            # Start message listening task
-            await asyncio.create_task(self._listen_messages())
+            # Start writer and message listening tasks in the background
+            self._start_writer()
+            self._listen_task = asyncio.create_task(self._listen_messages())
             
             # Send session configuration
             await self._send_session_update()
@@ -68,12 +88,12 @@ class OpenAIClient:
                 try:
                     await self.on_connected()
                 except Exception as e:
-                    logger.error(f"Error in connection callback: {e}")
+                    logger.error("Error in connection callback: %s", e)
             
             return True
             
         except Exception as e:
-            logger.error(f"Failed to connect to OpenAI API: {e}")
+            logger.error("Failed to connect to OpenAI API: %s", e)
             self.is_connected = False
             await self._handle_connection_failure()
             return False
@@ -98,9 +118,11 @@ class OpenAIClient:
             try:
                 await self.websocket.close()
             except Exception as e:
-                logger.error(f"Error closing OpenAI websocket: {e}")
+                logger.error("Error closing OpenAI websocket: %s", e)
             finally:
                 self.websocket = None
+        
+        await self._stop_background_tasks()
     
     async def send_message(self, message: Dict[str, Any]) -> bool:
         """
@@ -112,22 +134,62 @@ class OpenAIClient:
         Returns:
             Whether sending was successful
         """
-        if not self.is_connected or not self.websocket:
+        # Realtime API expects text frames, so decode orjson's UTF-8 bytes
+        return await self.send_raw(orjson.dumps(message).decode("utf-8"))
+    
+    async def send_raw(self, frame: str) -> bool:
+        """
+        Queue an already serialized JSON text frame for sending to OpenAI API
+        
+        Args:
+            frame: JSON text frame
+            
+        Returns:
+            Whether the frame was queued
+        """
+        queue = self._send_queue
+        if not self.is_connected or not self.websocket or not queue:
             logger.warning("OpenAI websocket not connected")
             return False
         
         try:
-            await self.websocket.send(json.dumps(message))
+            queue.put_nowait(frame)
             return True
-        except (ConnectionClosed, WebSocketException) as e:
-            logger.error(f"OpenAI websocket connection error: {e}")
-            await self._handle_disconnection()
-            return False
-        except Exception as e:
-            logger.error(f"Error sending message to OpenAI: {e}")
-            return False
+        except asyncio.QueueFull:
+            pass
+        
+        # Queue is full: wait for space, applying backpressure to the caller, but stop
+        # waiting if the writer for this queue goes away
+        return await self._put_when_ready(queue, self._send_closed, frame)
     
-    def set_message_handler(self, handler: Callable[[Dict[str, Any]], Awaitable[None]]):
+    @staticmethod
+    async def _put_when_ready(queue: asyncio.Queue, closed: asyncio.Event, frame: str) -> bool:
+        """
+        Wait until a full send queue has space or its writer stops
+        
+        Args:
+            queue: Send queue of the connection the frame is meant for
+            closed: Event set when that queue's writer stops
+            frame: JSON text frame
+            
+        Returns:
+            Whether the frame was queued
+        """
+        put_task = asyncio.ensure_future(queue.put(frame))
+        closed_task = asyncio.ensure_future(closed.wait())
+        try:
+            await asyncio.wait((put_task, closed_task), return_when=asyncio.FIRST_COMPLETED)
+        finally:
+            closed_task.cancel()
+            if not put_task.done():
+                put_task.cancel()
+        
+        if put_task.done() and not put_task.cancelled():
+            return True
+        logger.warning("OpenAI connection closed before frame could be queued")
+        return False
+    
+    def set_message_handler(self, handler: MessageHandler):
         """Set message handler"""
         self.message_handler = handler
     
@@ -140,6 +202,7 @@ class OpenAIClient:
     def update_session_config(self, config: Dict[str, Any]):
         """Update session configuration"""
         self.session_config = config
+        self._session_update_frame = None
     
     def configure_reconnect(self, auto_reconnect: bool = True, max_attempts: int = 5, initial_delay: float = 1.0,
                             max_delay: float = 30.0):
@@ -156,6 +219,22 @@ class OpenAIClient:
         self.max_reconnect_attempts = max_attempts
         self.reconnect_delay = initial_delay
         self.max_reconnect_delay = max_delay
+        self._delay_schedule = self._build_delay_schedule()
+    
+    def _build_delay_schedule(self) -> Tuple[float, ...]:
+        """
+        Precompute reconnect delays (exponential backoff)
+        
+        Each client applies its own random jitter once, so many clients dropped
+        at the same time do not reconnect in lockstep.
+        
+        Returns:
+            Delay in seconds for each reconnect attempt
+        """
+        return tuple(
+            min(self.reconnect_delay * (2 ** i) * random.uniform(0.8, 1.2), self.max_reconnect_delay)
+            for i in range(self.max_reconnect_attempts)
+        )
     
     async def _listen_messages(self):
         """Listen for messages from OpenAI"""
@@ -165,33 +244,84 @@ class OpenAIClient:
                     break
                 
                 try:
-                    data = json.loads(message)
+                    data = orjson.loads(message)
                     if self.message_handler:
-                        await self.message_handler(data)
-                except json.JSONDecodeError as e:
-                    logger.error(f"Failed to parse OpenAI message: {e}")
+                        await self.message_handler(data, message)
+                except orjson.JSONDecodeError as e:
+                    logger.error("Failed to parse OpenAI message: %s", e)
                 except Exception as e:
-                    logger.error(f"Error handling OpenAI message: {e}")
+                    logger.error("Error handling OpenAI message: %s", e)
                     
         except ConnectionClosed:
             logger.info("OpenAI websocket connection closed")
             await self._handle_disconnection()
         except Exception as e:
-            logger.error(f"Error in OpenAI message listener: {e}")
+            logger.error("Error in OpenAI message listener: %s", e)
             await self._handle_disconnection()
     
+    def _start_writer(self):
+        """Start the writer task for the current connection"""
+        self._cancel_writer()
+        self._send_queue = asyncio.Queue(maxsize=SEND_QUEUE_MAXSIZE)
+        self._send_closed = asyncio.Event()
+        self._writer_task = asyncio.create_task(self._write_messages(self.websocket, self._send_queue))
+    
+    def _cancel_writer(self):
+        """Cancel the writer task without waiting for it"""
+        task = self._writer_task
+        self._writer_task = None
+        self._send_queue = None
+        if self._send_closed:
+            self._send_closed.set()
+            self._send_closed = None
+        if task and not task.done() and task is not asyncio.current_task():
+            task.cancel()
+    
+    async def _write_messages(self, websocket: websockets.WebSocketClientProtocol, queue: asyncio.Queue):
+        """Write queued frames to OpenAI, draining everything already queued in one pass"""
+        while True:
+            frame = await queue.get()
+            try:
+                await websocket.send(frame)
+                # Realtime API has no multi-message framing, so send the backlog frame by frame
+                while not queue.empty():
+                    await websocket.send(queue.get_nowait())
+            except (ConnectionClosed, WebSocketException) as e:
+                logger.error("OpenAI websocket connection error: %s", e)
+                await self._handle_disconnection()
+                return
+            except Exception as e:
+                logger.error("Error sending message to OpenAI: %s", e)
+    
+    async def _stop_background_tasks(self, timeout: float = 5.0):
+        """Cancel the writer and message listening tasks and wait for them to finish"""
+        tasks = [self._writer_task, self._listen_task]
+        self._cancel_writer()
+        self._listen_task = None
+        
+        # disconnect() may be reached from a message handler running inside the listener
+        current = asyncio.current_task()
+        pending = {task for task in tasks if task and not task.done() and task is not current}
+        if not pending:
+            return
+        
+        for task in pending:
+            task.cancel()
+        await asyncio.wait(pending, timeout=timeout)
+    
     async def _handle_disconnection(self):
         """Handle connection disconnection"""
         if self.is_connected:
             self.is_connected = False
             logger.warning("OpenAI connection lost")
+            self._cancel_writer()
             
             # Call disconnection callback
             if self.on_disconnected:
                 try:
                     await self.on_disconnected()
                 except Exception as e:
-                    logger.error(f"Error in disconnection callback: {e}")
+                    logger.error("Error in disconnection callback: %s", e)
             
             # Attempt reconnection
             if self.auto_reconnect:
@@ -217,15 +347,10 @@ class OpenAIClient:
             
             self.current_reconnect_attempts += 1
             
-            # Calculate reconnection delay (exponential backoff)
-            delay = min(
-                self.reconnect_delay * (2 ** (self.current_reconnect_attempts - 1)),
-                self.max_reconnect_delay
-            )
+            delay = self._delay_schedule[self.current_reconnect_attempts - 1]
             
-            logger.info(f"Attempting to reconnect to OpenAI API "
-                        f"(attempt {self.current_reconnect_attempts}/{self.max_reconnect_attempts}) "
-                        f"in {delay:.1f}s...")
+            logger.info("Attempting to reconnect to OpenAI API (attempt %d/%d) in %.1fs...",
+                        self.current_reconnect_attempts, self.max_reconnect_attempts, delay)
             
             try:
                 await asyncio.sleep(delay)
@@ -242,22 +367,23 @@ class OpenAIClient:
                 logger.info("Reconnection cancelled")
                 break
             except Exception as e:
-                logger.error(f"Reconnection attempt failed: {e}")
+                logger.error("Reconnection attempt failed: %s", e)
         
         if (self.current_reconnect_attempts >= self.max_reconnect_attempts
                 and not self.is_connected):
-            logger.error(f"Failed to reconnect after {self.max_reconnect_attempts} attempts")
+            logger.error("Failed to reconnect after %d attempts", self.max_reconnect_attempts)
     
     async def _send_session_update(self):
         """Send session update configuration"""
-        config = self.session_config or {}
-        
-        # Use default configuration and merge with user configuration
-        default_config = OpenAISessionConfig()
-        session_data = default_config.model_dump()
-        session_data.update(config)
-        
-        session_update = OpenAISessionUpdate(session=OpenAISessionConfig(**session_data))
+        if self._session_update_frame is None:
+            config = self.session_config or {}
+            
+            # Use default configuration and merge with user configuration
+            session_data = dict(_DEFAULT_SESSION_DATA)
+            session_data.update(config)
+            
+            session_update = OpenAISessionUpdate(session=OpenAISessionConfig(**session_data))
+            self._session_update_frame = orjson.dumps(session_update.model_dump()).decode("utf-8")
         
-        await self.send_message(session_update.model_dump())
+        await self.send_raw(self._session_update_frame)
         logger.info("Session configuration sent to OpenAI")
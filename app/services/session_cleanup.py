@@ -3,9 +3,10 @@ Session cleanup service
 Periodically clean up expired sessions and connections to prevent memory leaks
 """
 import asyncio
+import heapq
 import logging
-from datetime import datetime, timedelta
-from typing import Dict, Set, Optional
+import time
+from typing import Dict, List, Set, Optional, Tuple
 
 logger = logging.getLogger(__name__)
 
@@ -13,9 +14,13 @@ logger = logging.getLogger(__name__)
 class SessionCleanupService:
     """Session cleanup service"""
     
-    def __init__(self, cleanup_interval: int = 300):  # 5 minutes
+    def __init__(self, cleanup_interval: int = 300, session_ttl: float = 3 * 3600):  # 5 minutes, 3 hours
         self.cleanup_interval = cleanup_interval
-        self.active_sessions: Dict[str, datetime] = {}
+        self.session_ttl = session_ttl
+        # Session ID -> last activity (time.monotonic())
+        self.active_sessions: Dict[str, float] = {}
+        # Min-heap of (expiry, session ID); entries superseded by re-registration are skipped lazily
+        self._expiry_heap: List[Tuple[float, str]] = []
         self.cleanup_task: Optional[asyncio.Task] = None
         self.is_running = False
     
@@ -35,7 +40,9 @@ class SessionCleanupService:
     
     def register_session(self, session_id: str):
         """Register active session"""
-        self.active_sessions[session_id] = datetime.now()
+        now = time.monotonic()
+        self.active_sessions[session_id] = now
+        heapq.heappush(self._expiry_heap, (now + self.session_ttl, session_id))
     
     def unregister_session(self, session_id: str):
         """Unregister session"""
@@ -54,14 +61,19 @@ class SessionCleanupService:
     
     async def _cleanup_expired_sessions(self):
         """Clean up expired sessions"""
-        now = datetime.now()
-        expired_threshold = now - timedelta(hours=3)  # 3 hours expiry
+        now = time.monotonic()
+        heap = self._expiry_heap
+        expired_sessions = []
         
-        expired_sessions = [
-            session_id for session_id, last_activity 
-            in self.active_sessions.items()
-            if last_activity < expired_threshold
-        ]
+        # Only pop entries that are due; the rest of the heap is untouched
+        while heap and heap[0][0] <= now:
+            expiry, session_id = heapq.heappop(heap)
+            last_activity = self.active_sessions.get(session_id)
+            
+            # Skip stale entries for unregistered or re-registered sessions
+            if last_activity is None or last_activity + self.session_ttl != expiry:
+                continue
+            expired_sessions.append(session_id)
         
         for session_id in expired_sessions:
             logger.info(f"Cleaning up expired session: {session_id}")
@@ -1,10 +1,13 @@
 """
 Session management service
-Manages session state between Twilio, OpenAI and frontend connections
+Manages per-call session state between Twilio, OpenAI and frontend connections
 """
-import json
+import asyncio
+import base64
 import logging
-from typing import Optional, Dict, Any
+from types import MappingProxyType
+from typing import Optional, Dict, Any, Callable, Awaitable, Mapping, Union
+import orjson
 from fastapi import WebSocket
 
 from app.models.schemas import SessionState, WebSocketMessageType
@@ -13,38 +16,89 @@ from app.services.function_handlers import function_handler_service
 
 logger = logging.getLogger(__name__)
 
+# Maximum number of outbound Twilio frames buffered before senders wait
+TWILIO_QUEUE_MAXSIZE = 512
+
+# Shared read-only default for missing nested objects, avoids allocating {} per frame
+_EMPTY: Mapping[str, Any] = MappingProxyType({})
+
+# Caller audio is coalesced for this long (seconds) before one append event is sent;
+# Twilio delivers 20 ms frames, so this batches about four frames per event
+AUDIO_FLUSH_INTERVAL = 0.08
+
+# input_audio_buffer.append frame split around the audio payload; Twilio payloads are
+# base64, which never needs JSON escaping, so they can be spliced in directly
+_AUDIO_APPEND_PREFIX = (
+    '{"type":"' + WebSocketMessageType.OPENAI_INPUT_AUDIO_BUFFER_APPEND.value + '","audio":"'
+)
+_AUDIO_APPEND_SUFFIX = '"}'
+
+# Static connection status frames for the frontend
+_OPENAI_CONNECTED_FRAME = orjson.dumps({
+    "type": "connection_status",
+    "status": "openai_connected",
+    "message": "OpenAI connection established"
+}).decode("utf-8")
+_OPENAI_DISCONNECTED_FRAME = orjson.dumps({
+    "type": "connection_status",
+    "status": "openai_disconnected",
+    "message": "OpenAI connection lost, reconnecting..."
+}).decode("utf-8")
+
 
 class SessionManager:
-    """Session manager"""
+    """Session manager for a single Twilio call"""
 
-    def __init__(self):
+    __slots__ = (
+        "registry", "state", "twilio_websocket", "openai_client",
+        "_mark_frame", "_clear_frame", "_twilio_out", "_twilio_writer_task",
+        "_pending_audio", "_audio_flush_task", "_twilio_dispatch", "_openai_dispatch",
+        "_teardown_task",
+    )
+
+    def __init__(self, registry: Optional["SessionRegistry"] = None):
+        self.registry = registry
         self.state = SessionState()
         self.twilio_websocket: Optional[WebSocket] = None
-        self.frontend_websocket: Optional[WebSocket] = None
         self.openai_client: Optional[OpenAIClient] = None
+        # Control frames for the current stream, serialized once per stream_sid
+        self._mark_frame: Optional[str] = None
+        self._clear_frame: Optional[str] = None
+        # Outbound Twilio frames are written by a single writer task per connection
+        self._twilio_out: Optional[asyncio.Queue] = None
+        self._twilio_writer_task: Optional[asyncio.Task] = None
+        # Caller audio waiting to be sent to OpenAI as one append event
+        self._pending_audio = bytearray()
+        self._audio_flush_task: Optional[asyncio.Task] = None
+        # Teardown runs once in its own task so cancelling a caller cannot interrupt it
+        self._teardown_task: Optional[asyncio.Task] = None
+
+        # Message dispatch tables, keyed by plain event/type strings
+        self._twilio_dispatch: Dict[str, Callable[[Dict[str, Any]], Awaitable[None]]] = {
+            WebSocketMessageType.TWILIO_START.value: self._handle_twilio_start,
+            WebSocketMessageType.TWILIO_MEDIA.value: self._handle_twilio_media,
+            WebSocketMessageType.TWILIO_CLOSE.value: lambda message: self._handle_twilio_close(),
+        }
+        self._openai_dispatch: Dict[str, Callable[[Dict[str, Any]], Awaitable[None]]] = {
+            WebSocketMessageType.OPENAI_INPUT_AUDIO_BUFFER_SPEECH_STARTED.value:
+                lambda message: self._handle_speech_started(),
+            WebSocketMessageType.OPENAI_RESPONSE_AUDIO_DELTA.value: self._handle_audio_delta,
+            WebSocketMessageType.OPENAI_RESPONSE_OUTPUT_ITEM_DONE.value: self._handle_output_item_done,
+        }
 
     async def handle_twilio_connection(self, websocket: WebSocket):
         """Handle Twilio WebSocket connection"""
         await self._cleanup_twilio_connection()
         self.twilio_websocket = websocket
+        self._twilio_out = asyncio.Queue(maxsize=TWILIO_QUEUE_MAXSIZE)
+        self._twilio_writer_task = asyncio.create_task(self._twilio_writer(websocket, self._twilio_out))
         logger.info("Twilio WebSocket connected")
 
-    async def handle_frontend_connection(self, websocket: WebSocket):
-        """Handle frontend WebSocket connection"""
-        await self._cleanup_frontend_connection()
-        self.frontend_websocket = websocket
-        logger.info("Frontend WebSocket connected")
-
     async def handle_twilio_message(self, message: Dict[str, Any]):
         """Handle messages from Twilio"""
-        event = message.get("event")
-
-        if event == WebSocketMessageType.TWILIO_START:
-            await self._handle_twilio_start(message)
-        elif event == WebSocketMessageType.TWILIO_MEDIA:
-            await self._handle_twilio_media(message)
-        elif event == WebSocketMessageType.TWILIO_CLOSE:
-            await self._handle_twilio_close()
+        handler = self._twilio_dispatch.get(message.get("event"))
+        if handler:
+            await handler(message)
 
     async def handle_frontend_message(self, message: Dict[str, Any]):
         """Handle messages from frontend"""
@@ -56,27 +110,43 @@ class SessionManager:
         if message.get("type") == WebSocketMessageType.OPENAI_SESSION_UPDATE:
             self.state.saved_config = message.get("session", {})
 
-    async def handle_openai_message(self, message: Dict[str, Any]):
-        """Handle messages from OpenAI"""
+    async def handle_openai_message(self, message: Dict[str, Any], raw: Union[str, bytes, None] = None):
+        """
+        Handle messages from OpenAI
+        
+        Args:
+            message: Parsed message, used for routing
+            raw: Original frame, forwarded to the frontend as-is when available
+        """
         # Forward to frontend for monitoring
-        await self._send_to_frontend(message)
-
-        message_type = message.get("type")
+        if raw is None:
+            await self._send_to_frontend(message)
+        elif self.registry:
+            if isinstance(raw, bytes):
+                raw = raw.decode("utf-8")
+            await self.registry.send_frame_to_frontend(raw)
 
-        if message_type == WebSocketMessageType.OPENAI_INPUT_AUDIO_BUFFER_SPEECH_STARTED:
-            await self._handle_speech_started()
-        elif message_type == WebSocketMessageType.OPENAI_RESPONSE_AUDIO_DELTA:
-            await self._handle_audio_delta(message)
-        elif message_type == WebSocketMessageType.OPENAI_RESPONSE_OUTPUT_ITEM_DONE:
-            await self._handle_output_item_done(message)
+        handler = self._openai_dispatch.get(message.get("type"))
+        if handler:
+            await handler(message)
 
     async def disconnect_all(self):
-        """Disconnect all connections"""
-        await self._cleanup_twilio_connection()
-        await self._cleanup_frontend_connection()
-        await self._cleanup_openai_connection()
-        self.state = SessionState()
-        logger.info("All connections disconnected")
+        """Disconnect all connections of this call, safe to call more than once"""
+        if self._teardown_task is None:
+            self._teardown_task = asyncio.create_task(self._teardown())
+        await asyncio.shield(self._teardown_task)
+
+    async def _teardown(self):
+        """Close Twilio and OpenAI connections, then leave the registry"""
+        websocket = self.twilio_websocket
+        try:
+            await self._cleanup_twilio_connection()
+            await self._cleanup_openai_connection()
+        finally:
+            if self.registry:
+                self.registry.unregister_session(self, websocket)
+            self.state = SessionState()
+        logger.info("All call connections disconnected")
 
     def _safe_int(self, value, default=0):
         """Safely convert to integer"""
@@ -87,29 +157,59 @@ class SessionManager:
 
     async def _handle_twilio_start(self, message: Dict[str, Any]):
         """Handle Twilio start message"""
-        start_data = message.get("start", {})
+        start_data = message.get("start", _EMPTY)
         self.state.stream_sid = start_data.get("streamSid")
         self.state.latest_media_timestamp = 0
         self.state.last_assistant_item = None
         self.state.response_start_timestamp = None
+        self._mark_frame = orjson.dumps({
+            "event": "mark",
+            "streamSid": self.state.stream_sid
+        }).decode("utf-8")
+        self._clear_frame = orjson.dumps({
+            "event": "clear",
+            "streamSid": self.state.stream_sid
+        }).decode("utf-8")
 
         logger.info(f"Twilio stream started: {self.state.stream_sid}")
+        if self.registry:
+            self.registry.register_session(self)
         await self._try_connect_openai()
 
     async def _handle_twilio_media(self, message: Dict[str, Any]):
         """Handle Twilio media message"""
-        media_data = message.get("media", {})
-        # Safely handle timestamp
-        timestamp = media_data.get("timestamp", 0)
-        self.state.latest_media_timestamp = self._safe_int(timestamp)
+        media_data = message.get("media", _EMPTY)
+        # Twilio sends the timestamp as a string; store it as-is and convert only
+        # when it is needed for truncation
+        self.state.latest_media_timestamp = media_data.get("timestamp", 0)
 
-        # Forward audio to OpenAI
+        # Buffer audio and forward it to OpenAI in batches
         if self.openai_client and self.openai_client.is_connected:
-            audio_message = {
-                "type": WebSocketMessageType.OPENAI_INPUT_AUDIO_BUFFER_APPEND,
-                "audio": media_data.get("payload", "")
-            }
-            await self.openai_client.send_message(audio_message)
+            payload = media_data.get("payload")
+            if payload:
+                try:
+                    self._pending_audio += base64.b64decode(payload)
+                except ValueError as e:
+                    logger.error(f"Invalid Twilio media payload: {e}")
+                    return
+                if self._audio_flush_task is None:
+                    self._audio_flush_task = asyncio.create_task(self._flush_audio_later(AUDIO_FLUSH_INTERVAL))
+
+    async def _flush_audio_later(self, delay: float):
+        """Send buffered caller audio to OpenAI as a single append event after a delay"""
+        try:
+            await asyncio.sleep(delay)
+        finally:
+            self._audio_flush_task = None
+
+        if not self._pending_audio:
+            return
+
+        payload = base64.b64encode(self._pending_audio).decode("ascii")
+        self._pending_audio.clear()
+
+        if self.openai_client:
+            await self.openai_client.send_raw(_AUDIO_APPEND_PREFIX + payload + _AUDIO_APPEND_SUFFIX)
 
     async def _handle_twilio_close(self):
         """Handle Twilio close message"""
@@ -145,15 +245,11 @@ class SessionManager:
             await self._send_to_twilio(media_message)
 
             # Send mark
-            mark_message = {
-                "event": "mark",
-                "streamSid": self.state.stream_sid
-            }
-            await self._send_to_twilio(mark_message)
+            await self._send_frame_to_twilio(self._mark_frame)
 
     async def _handle_output_item_done(self, message: Dict[str, Any]):
         """Handle output item done message"""
-        item = message.get("item", {})
+        item = message.get("item", _EMPTY)
 
         if item.get("type") == "function_call":
             await self._handle_function_call(item)
@@ -216,13 +312,10 @@ class SessionManager:
             }
             await self.openai_client.send_message(truncate_message)
 
-        # Clear Twilio audio buffer
+        # Clear Twilio audio buffer, dropping audio that has not been written yet
         if self.twilio_websocket and self.state.stream_sid:
-            clear_message = {
-                "event": "clear",
-                "streamSid": self.state.stream_sid
-            }
-            await self._send_to_twilio(clear_message)
+            self._discard_pending_twilio_frames()
+            await self._send_frame_to_twilio(self._clear_frame)
 
         # Reset state
         self.state.last_assistant_item = None
@@ -265,22 +358,47 @@ class SessionManager:
 
     async def _send_to_twilio(self, message: Dict[str, Any]):
         """Send message to Twilio"""
-        if self.twilio_websocket:
+        await self._send_frame_to_twilio(orjson.dumps(message).decode("utf-8"))
+
+    async def _send_frame_to_twilio(self, frame: Optional[str]):
+        """Queue an already serialized frame for the Twilio writer"""
+        if self._twilio_out is not None and frame:
+            # Waits when the queue is full instead of dropping audio
+            await self._twilio_out.put(frame)
+
+    async def _twilio_writer(self, websocket: WebSocket, queue: asyncio.Queue):
+        """Write queued frames to Twilio, draining everything already queued in one pass"""
+        while True:
+            frame = await queue.get()
+            # Twilio Media Streams only accepts one JSON text message per frame
             try:
-                await self.twilio_websocket.send_text(json.dumps(message))
+                await websocket.send_text(frame)
+                while not queue.empty():
+                    await websocket.send_text(queue.get_nowait())
             except Exception as e:
                 logger.error(f"Error sending to Twilio: {e}")
 
+    def _discard_pending_twilio_frames(self):
+        """Drop frames queued for Twilio that have not been written yet"""
+        queue = self._twilio_out
+        if queue is None:
+            return
+        while not queue.empty():
+            queue.get_nowait()
+
     async def _send_to_frontend(self, message: Dict[str, Any]):
         """Send message to frontend"""
-        if self.frontend_websocket:
-            try:
-                await self.frontend_websocket.send_text(json.dumps(message))
-            except Exception as e:
-                logger.error(f"Error sending to frontend: {e}")
+        if self.registry:
+            await self.registry.send_to_frontend(message)
 
     async def _cleanup_twilio_connection(self):
         """Clean up Twilio connection"""
+        writer_task = self._twilio_writer_task
+        self._twilio_writer_task = None
+        self._twilio_out = None
+        if writer_task and not writer_task.done():
+            writer_task.cancel()
+
         if self.twilio_websocket:
             try:
                 await self.twilio_websocket.close()
@@ -289,18 +407,14 @@ class SessionManager:
             finally:
                 self.twilio_websocket = None
 
-    async def _cleanup_frontend_connection(self):
-        """Clean up frontend connection"""
-        if self.frontend_websocket:
-            try:
-                await self.frontend_websocket.close()
-            except Exception as e:
-                logger.error(f"Error closing frontend websocket: {e}")
-            finally:
-                self.frontend_websocket = None
-
     async def _cleanup_openai_connection(self):
         """Clean up OpenAI connection"""
+        flush_task = self._audio_flush_task
+        self._audio_flush_task = None
+        if flush_task and not flush_task.done():
+            flush_task.cancel()
+        self._pending_audio.clear()
+
         if self.openai_client:
             await self.openai_client.disconnect()
             self.openai_client = None
@@ -309,22 +423,114 @@ class SessionManager:
         """OpenAI's connection success callback"""
         logger.info("OpenAI reconnected successfully")
         # Can add initialization logic after reconnection here
-        await self._send_to_frontend({
-            "type": "connection_status",
-            "status": "openai_connected",
-            "message": "OpenAI connection established"
-        })
+        if self.registry:
+            await self.registry.send_frame_to_frontend(_OPENAI_CONNECTED_FRAME)
 
     async def _on_openai_disconnected(self):
         """OpenAI's connection disconnected callback"""
         logger.warning("OpenAI connection lost, attempting to reconnect...")
         # Notify frontend of connection status
-        await self._send_to_frontend({
-            "type": "connection_status",
-            "status": "openai_disconnected",
-            "message": "OpenAI connection lost, reconnecting..."
-        })
+        if self.registry:
+            await self.registry.send_frame_to_frontend(_OPENAI_DISCONNECTED_FRAME)
+
+
+class SessionRegistry:
+    """Registry of per-call sessions sharing one frontend monitoring connection"""
+
+    def __init__(self):
+        # Active calls keyed by Twilio stream SID
+        self.sessions: Dict[str, SessionManager] = {}
+        # All calls keyed by Twilio WebSocket, including ones that have not started streaming
+        self._connections: Dict[WebSocket, SessionManager] = {}
+        self.frontend_websocket: Optional[WebSocket] = None
+        # Session configuration from the frontend, applied to new calls
+        self.saved_config: Optional[Dict[str, Any]] = None
+
+    async def handle_twilio_connection(self, websocket: WebSocket) -> SessionManager:
+        """
+        Handle Twilio WebSocket connection
+        
+        Args:
+            websocket: Twilio WebSocket connection
+            
+        Returns:
+            New session for the call
+        """
+        session = SessionManager(registry=self)
+        session.state.saved_config = self.saved_config
+        await session.handle_twilio_connection(websocket)
+        self._connections[websocket] = session
+        return session
+
+    async def handle_frontend_connection(self, websocket: WebSocket):
+        """Handle frontend WebSocket connection"""
+        await self._cleanup_frontend_connection()
+        self.frontend_websocket = websocket
+        logger.info("Frontend WebSocket connected")
+
+    async def handle_frontend_message(self, message: Dict[str, Any]):
+        """Handle messages from frontend, forwarding them to every active call"""
+        # If it's a session update, save configuration for future calls
+        if message.get("type") == WebSocketMessageType.OPENAI_SESSION_UPDATE:
+            self.saved_config = message.get("session", {})
+
+        for session in list(self.sessions.values()):
+            await session.handle_frontend_message(message)
+
+    def register_session(self, session: SessionManager):
+        """Register a session under its stream SID"""
+        if session.state.stream_sid:
+            self.sessions[session.state.stream_sid] = session
+
+    def unregister_session(self, session: SessionManager, websocket: Optional[WebSocket] = None):
+        """
+        Remove a session from the registry
+        
+        Args:
+            session: Session to remove
+            websocket: Twilio WebSocket the session was registered under, defaults to its current one
+        """
+        if websocket is None:
+            websocket = session.twilio_websocket
+        if websocket is not None and self._connections.get(websocket) is session:
+            del self._connections[websocket]
+
+        stream_sid = session.state.stream_sid
+        if stream_sid and self.sessions.get(stream_sid) is session:
+            del self.sessions[stream_sid]
+
+    async def send_to_frontend(self, message: Dict[str, Any]):
+        """Send message to frontend"""
+        if self.frontend_websocket:
+            await self.send_frame_to_frontend(orjson.dumps(message).decode("utf-8"))
+
+    async def send_frame_to_frontend(self, frame: str):
+        """Send an already serialized JSON text frame to frontend"""
+        if self.frontend_websocket:
+            try:
+                await self.frontend_websocket.send_text(frame)
+            except Exception as e:
+                logger.error(f"Error sending to frontend: {e}")
+
+    async def disconnect_all(self):
+        """Disconnect all calls and the frontend connection (used on shutdown)"""
+        for session in list(self._connections.values()):
+            await session.disconnect_all()
+        self._connections.clear()
+        self.sessions.clear()
+        await self._cleanup_frontend_connection()
+        logger.info("All connections disconnected")
+
+    async def _cleanup_frontend_connection(self):
+        """Clean up frontend connection"""
+        if self.frontend_websocket:
+            try:
+                await self.frontend_websocket.close()
+            except Exception as e:
+                logger.error(f"Error closing frontend websocket: {e}")
+            finally:
+                self.frontend_websocket = None
 
 
-# Global session manager instance
-session_manager = SessionManager()
+# Global session registry instance
+session_manager = SessionRegistry()
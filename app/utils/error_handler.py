@@ -4,7 +4,11 @@ Unified error handling and retry mechanisms
 """
 import asyncio
 import logging
+import sys
+import time
+from collections import deque
 from functools import wraps
+from itertools import islice
 from typing import Callable, Any, Optional, Type, Union
 import traceback
 
@@ -38,31 +42,33 @@ def async_retry(max_attempts: int = 3,
     def decorator(func: Callable) -> Callable:
         @wraps(func)
         async def wrapper(*args, **kwargs):
-            last_exception = None
+            # Fast path: first attempt without any retry bookkeeping
+            try:
+                return await func(*args, **kwargs)
+            except exceptions as e:
+                # Check if it's a critical error
+                if isinstance(e, CriticalError):
+                    logger.error(f"Critical error in {func.__name__}: {e}")
+                    raise
+                last_exception = e
+
             current_delay = delay
+            for attempt in range(1, max_attempts):
+                logger.warning(
+                    f"Attempt {attempt}/{max_attempts} failed for {func.__name__}: {last_exception}. "
+                    f"Retrying in {current_delay}s..."
+                )
+
+                await asyncio.sleep(current_delay)
+                current_delay *= backoff
 
-            for attempt in range(max_attempts):
                 try:
                     return await func(*args, **kwargs)
                 except exceptions as e:
-                    last_exception = e
-
-                    # Check if it's a critical error
                     if isinstance(e, CriticalError):
                         logger.error(f"Critical error in {func.__name__}: {e}")
                         raise
-
-                    # Last attempt, no more retries
-                    if attempt == max_attempts - 1:
-                        break
-
-                    logger.warning(
-                        f"Attempt {attempt + 1}/{max_attempts} failed for {func.__name__}: {e}. "
-                        f"Retrying in {current_delay}s..."
-                    )
-
-                    await asyncio.sleep(current_delay)
-                    current_delay *= backoff
+                    last_exception = e
 
             # All retries failed
             logger.error(f"All {max_attempts} attempts failed for {func.__name__}")
@@ -96,12 +102,11 @@ def log_performance(func: Callable) -> Callable:
 
     @wraps(func)
     async def wrapper(*args, **kwargs):
-        import time
-        start_time = time.time()
+        start_time = time.perf_counter()
 
         try:
             result = await func(*args, **kwargs)
-            execution_time = time.time() - start_time
+            execution_time = time.perf_counter() - start_time
 
             if execution_time > 1.0:  # Log warning if over 1 second
                 logger.warning(f"{func.__name__} took {execution_time:.2f}s to execute")
@@ -110,7 +115,7 @@ def log_performance(func: Callable) -> Callable:
 
             return result
         except Exception as e:
-            execution_time = time.time() - start_time
+            execution_time = time.perf_counter() - start_time
             logger.error(f"{func.__name__} failed after {execution_time:.3f}s: {e}")
             raise
 
@@ -120,28 +125,32 @@ def log_performance(func: Callable) -> Callable:
 class ErrorCollector:
     """Error collector"""
 
+    __slots__ = ("max_errors", "errors", "error_counts")
+
     def __init__(self, max_errors: int = 100):
         self.max_errors = max_errors
-        self.errors: list = []
+        # Oldest errors are evicted automatically once max_errors is reached
+        self.errors: deque = deque(maxlen=max_errors)
         self.error_counts: dict = {}
 
     def add_error(self, error: Exception, context: str = ""):
         """Add error record"""
         error_info = {
-            "timestamp": asyncio.get_event_loop().time(),
+            "timestamp": time.monotonic(),
             "error_type": type(error).__name__,
             "message": str(error),
             "context": context,
-            "traceback": traceback.format_exc()
+            "traceback": None
         }
 
+        # Keep the active exception and format its traceback lazily in get_error_summary
+        exc_info = sys.exc_info()
+        if exc_info[0] is not None:
+            error_info["_exc_info"] = exc_info
+
         # Add to error list
         self.errors.append(error_info)
 
-        # Maintain maximum error count
-        if len(self.errors) > self.max_errors:
-            self.errors.pop(0)
-
         # Count error occurrences
         error_key = f"{error_info['error_type']}:{error_info['context']}"
         self.error_counts[error_key] = self.error_counts.get(error_key, 0) + 1
@@ -151,9 +160,20 @@ class ErrorCollector:
         return {
             "total_errors": len(self.errors),
             "error_counts": self.error_counts,
-            "recent_errors": self.errors[-5:] if self.errors else []
+            "recent_errors": [
+                self._format_traceback(error_info)
+                for error_info in islice(self.errors, max(len(self.errors) - 5, 0), None)
+            ]
         }
 
+    @staticmethod
+    def _format_traceback(error_info: dict) -> dict:
+        """Format a deferred traceback in place, releasing the stored exception"""
+        exc_info = error_info.pop("_exc_info", None)
+        if exc_info is not None:
+            error_info["traceback"] = "".join(traceback.format_exception(*exc_info))
+        return error_info
+
 
 # Global error collector
 error_collector = ErrorCollector()
@@ -3,6 +3,7 @@ Health check and monitoring service
 """
 import asyncio
 import logging
+import time
 import psutil
 from datetime import datetime
 from typing import Dict, List, Optional
@@ -10,8 +11,11 @@ from dataclasses import dataclass
 
 logger = logging.getLogger(__name__)
 
+# Disk usage changes slowly, so it is sampled at most this often (seconds)
+DISK_USAGE_CACHE_TTL = 30.0
 
-@dataclass
+
+@dataclass(slots=True)
 class HealthStatus:
     """Health status"""
     service: str
@@ -27,6 +31,11 @@ class HealthChecker:
     def __init__(self):
         self.checks: Dict[str, callable] = {}
         self.last_results: Dict[str, HealthStatus] = {}
+        # Cached disk usage: (monotonic time sampled, usage)
+        self._disk_usage_cache: Optional[tuple] = None
+
+        # Prime CPU sampling so later non-blocking calls measure since the previous call
+        psutil.cpu_percent(interval=None)
 
     def register_check(self, name: str, check_func: callable):
         """Register health check"""
@@ -34,45 +43,54 @@ class HealthChecker:
         logger.info(f"Registered health check: {name}")
 
     async def run_all_checks(self) -> List[HealthStatus]:
-        """Run all health checks"""
-        results = []
-
-        for name, check_func in self.checks.items():
-            try:
-                result = await check_func()
-                if not isinstance(result, HealthStatus):
-                    result = HealthStatus(
-                        service=name,
-                        status='critical',
-                        message=f"Invalid health check result for {name}",
-                        timestamp=datetime.now()
-                    )
-            except Exception as e:
-                logger.error(f"Health check {name} failed: {e}")
+        """Run all health checks concurrently"""
+        checks = list(self.checks.items())
+        results = await asyncio.gather(
+            *(self._run_check(name, check_func) for name, check_func in checks)
+        )
+
+        # Build a new mapping and swap it in, so readers always see a complete snapshot
+        new_results = dict(self.last_results)
+        for (name, _), result in zip(checks, results):
+            new_results[name] = result
+        self.last_results = new_results
+
+        return list(results)
+
+    async def _run_check(self, name: str, check_func: callable) -> HealthStatus:
+        """Run a single health check, converting failures to a critical status"""
+        try:
+            result = await check_func()
+            if not isinstance(result, HealthStatus):
                 result = HealthStatus(
                     service=name,
                     status='critical',
-                    message=f"Health check failed: {str(e)}",
+                    message=f"Invalid health check result for {name}",
                     timestamp=datetime.now()
                 )
+        except Exception as e:
+            logger.error(f"Health check {name} failed: {e}")
+            result = HealthStatus(
+                service=name,
+                status='critical',
+                message=f"Health check failed: {str(e)}",
+                timestamp=datetime.now()
+            )
 
-            results.append(result)
-            self.last_results[name] = result
-
-        return results
+        return result
 
     async def get_system_health(self) -> HealthStatus:
         """System resource health check"""
         try:
-            # CPU usage
-            cpu_percent = psutil.cpu_percent(interval=1)
+            # CPU usage since the previous call (non-blocking)
+            cpu_percent = psutil.cpu_percent(interval=None)
 
             # Memory usage
             memory = psutil.virtual_memory()
             memory_percent = memory.percent
 
             # Disk usage
-            disk = psutil.disk_usage('/')
+            disk = await self._get_disk_usage()
             disk_percent = disk.percent
 
             # Evaluate health status
@@ -114,16 +132,25 @@ class HealthChecker:
                 timestamp=datetime.now()
             )
 
+    async def _get_disk_usage(self):
+        """Get root disk usage, sampled off the event loop and cached"""
+        now = time.monotonic()
+        if self._disk_usage_cache is not None and now - self._disk_usage_cache[0] < DISK_USAGE_CACHE_TTL:
+            return self._disk_usage_cache[1]
+
+        disk = await asyncio.to_thread(psutil.disk_usage, '/')
+        self._disk_usage_cache = (now, disk)
+        return disk
+
     async def check_websocket_connections(self) -> HealthStatus:
         """WebSocket connection health check"""
         try:
             from ..websocket.connection_manager import connection_manager
 
-            active_connections = len(connection_manager.active_connections)
-            call_connections = len(connection_manager.call_connections)
-            log_connections = len(connection_manager.log_connections)
+            call_connections = connection_manager.get_connection_count("call")
+            log_connections = connection_manager.get_connection_count("logs")
 
-            total_connections = active_connections + call_connections + log_connections
+            total_connections = call_connections + log_connections
 
             status = 'healthy'
             message = f"WebSocket connections: {total_connections} active"
@@ -141,7 +168,6 @@ class HealthChecker:
                 message=message,
                 timestamp=datetime.now(),
                 details={
-                    'active_connections': active_connections,
                     'call_connections': call_connections,
                     'log_connections': log_connections,
                     'total_connections': total_connections
@@ -2,8 +2,10 @@
 WebSocket connection manager
 Manages multiple WebSocket connections and connection pools
 """
+import asyncio
 import logging
-from typing import Dict, List, Optional
+import weakref
+from typing import Dict, MutableMapping, Optional, Set
 from fastapi import WebSocket, WebSocketDisconnect
 
 logger = logging.getLogger(__name__)
@@ -14,12 +16,13 @@ class ConnectionManager:
 
     def __init__(self):
         # Active connection pools
-        self.active_connections: Dict[str, List[WebSocket]] = {
-            "call": [],  # Twilio call connections
-            "logs": []  # Frontend log connections
+        self.active_connections: Dict[str, Set[WebSocket]] = {
+            "call": set(),  # Twilio call connections
+            "logs": set()  # Frontend log connections
         }
-        # Connection to type mapping
-        self.connection_types: Dict[WebSocket, str] = {}
+        # Connection to type mapping; entries vanish with their WebSocket even if
+        # disconnect() is never called for it
+        self.connection_types: MutableMapping[WebSocket, str] = weakref.WeakKeyDictionary()
 
     async def connect(self, websocket: WebSocket, connection_type: str):
         """
@@ -31,20 +34,16 @@ class ConnectionManager:
         """
         await websocket.accept()
 
-        # If it's a call connection, disconnect previous connections (only allow one call connection)
-        if connection_type == "call" and self.active_connections["call"]:
-            for old_ws in self.active_connections["call"]:
-                await self._disconnect_websocket(old_ws)
-            self.active_connections["call"].clear()
+        # Call connections are independent sessions, so several may be active at once
 
         # If it's a logs connection, disconnect previous connections (only allow one logs connection)
         if connection_type == "logs" and self.active_connections["logs"]:
-            for old_ws in self.active_connections["logs"]:
+            for old_ws in list(self.active_connections["logs"]):
                 await self._disconnect_websocket(old_ws)
             self.active_connections["logs"].clear()
 
         # Add new connection
-        self.active_connections[connection_type].append(websocket)
+        self.active_connections[connection_type].add(websocket)
         self.connection_types[websocket] = connection_type
 
         logger.info(f"WebSocket connected: {connection_type}")
@@ -56,10 +55,9 @@ class ConnectionManager:
         Args:
             websocket: WebSocket connection to disconnect
         """
-        connection_type = self.connection_types.get(websocket)
-        if connection_type and websocket in self.active_connections[connection_type]:
-            self.active_connections[connection_type].remove(websocket)
-            del self.connection_types[websocket]
+        connection_type = self.connection_types.pop(websocket, None)
+        if connection_type:
+            self.active_connections[connection_type].discard(websocket)
             logger.info(f"WebSocket disconnected: {connection_type}")
 
     async def send_to_connection(self, websocket: WebSocket, message: str):
@@ -87,17 +85,22 @@ class ConnectionManager:
         if connection_type not in self.active_connections:
             return
 
-        disconnected = []
-        for websocket in self.active_connections[connection_type]:
-            try:
-                await websocket.send_text(message)
-            except Exception as e:
-                logger.error(f"Error broadcasting to {connection_type}: {e}")
-                disconnected.append(websocket)
+        # Snapshot the set since it may change while sends are awaited
+        connections = list(self.active_connections[connection_type])
+        if not connections:
+            return
+
+        # Send to all peers concurrently so one slow peer does not delay the rest
+        results = await asyncio.gather(
+            *(websocket.send_text(message) for websocket in connections),
+            return_exceptions=True
+        )
 
         # Clean up disconnected connections
-        for ws in disconnected:
-            self.disconnect(ws)
+        for websocket, result in zip(connections, results):
+            if isinstance(result, Exception):
+                logger.error(f"Error broadcasting to {connection_type}: {result}")
+                self.disconnect(websocket)
 
     def get_connection_count(self, connection_type: str) -> int:
         """
@@ -109,7 +112,7 @@ class ConnectionManager:
         Returns:
             Connection count
         """
-        return len(self.active_connections.get(connection_type, []))
+        return len(self.active_connections.get(connection_type, ()))
 
     def get_active_connection(self, connection_type: str) -> Optional[WebSocket]:
         """
@@ -121,8 +124,7 @@ class ConnectionManager:
         Returns:
             WebSocket connection or None
         """
-        connections = self.active_connections.get(connection_type, [])
-        return connections[0] if connections else None
+        return next(iter(self.active_connections.get(connection_type, ())), None)
 
     async def _disconnect_websocket(self, websocket: WebSocket):
         """
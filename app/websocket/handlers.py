@@ -2,9 +2,10 @@
 WebSocket message handler
 Handle different types of WebSocket connections and messages
 """
-import json
+import asyncio
 import logging
 from typing import Dict, Any
+import orjson
 from fastapi import WebSocket, WebSocketDisconnect
 
 from app.websocket.connection_manager import connection_manager
@@ -12,82 +13,160 @@ from app.services.session_manager import session_manager
 
 logger = logging.getLogger(__name__)
 
+# Bound once to skip the module attribute lookup per frame
+_loads = orjson.loads
 
-class WebSocketHandler:
-    """WebSocket handler class"""
+# Parsed Twilio frames buffered between receive and dispatch; a full queue stops reads
+CALL_QUEUE_MAXSIZE = 64
 
-    @staticmethod
-    async def handle_call_connection(websocket: WebSocket):
-        """
-        Handle Twilio call WebSocket connection
-        
-        Args:
-            websocket: Twilio WebSocket connection
-        """
+
+async def handle_call_connection(websocket: WebSocket):
+    """
+    Handle Twilio call WebSocket connection
+    
+    Args:
+        websocket: Twilio WebSocket connection
+    """
+    session = None
+    try:
+        await connection_manager.connect(websocket, "call")
+        session = await session_manager.handle_twilio_connection(websocket)
+
+        # Receive and dispatch run separately so a slow dispatch applies
+        # backpressure through the bounded queue instead of buffering frames
+        queue: asyncio.Queue = asyncio.Queue(maxsize=CALL_QUEUE_MAXSIZE)
+        tasks = (
+            asyncio.create_task(_receive_messages(websocket, queue)),
+            asyncio.create_task(_dispatch_messages(session.handle_twilio_message, queue)),
+        )
         try:
-            await connection_manager.connect(websocket, "call")
-            await session_manager.handle_twilio_connection(websocket)
+            done, _ = await asyncio.wait(tasks, return_when=asyncio.FIRST_COMPLETED)
+        finally:
+            # Session teardown is shielded, so cancelling a dispatcher inside it is safe
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
 
-            while True:
-                # Receive messages
-                data = await websocket.receive_text()
-                message = WebSocketHandler._parse_message(data)
+        # Re-raise disconnect or dispatch errors from whichever side stopped
+        for task in done:
+            task.result()
 
-                if message:
-                    await session_manager.handle_twilio_message(message)
+    except WebSocketDisconnect:
+        logger.debug("Twilio WebSocket disconnected")
+    except Exception as e:
+        logger.error("Error in Twilio WebSocket handler: %s", e)
+    finally:
+        connection_manager.disconnect(websocket)
+        if session is not None:
+            await session.disconnect_all()
 
-        except WebSocketDisconnect:
-            logger.info("Twilio WebSocket disconnected")
-        except Exception as e:
-            logger.error(f"Error in Twilio WebSocket handler: {e}")
-        finally:
-            connection_manager.disconnect(websocket)
-            await session_manager.disconnect_all()
 
-    @staticmethod
-    async def handle_logs_connection(websocket: WebSocket):
-        """
-        Handle frontend logs WebSocket connection
-        
-        Args:
-            websocket: Frontend WebSocket connection
-        """
-        try:
-            await connection_manager.connect(websocket, "logs")
-            await session_manager.handle_frontend_connection(websocket)
+async def handle_logs_connection(websocket: WebSocket):
+    """
+    Handle frontend logs WebSocket connection
+    
+    Args:
+        websocket: Frontend WebSocket connection
+    """
+    try:
+        await connection_manager.connect(websocket, "logs")
+        await session_manager.handle_frontend_connection(websocket)
 
-            while True:
-                # Receive messages
-                data = await websocket.receive_text()
-                message = WebSocketHandler._parse_message(data)
+        recv = websocket.receive
+        receive_frame = _receive_frame
+        parse = _parse_message
+        dispatch = session_manager.handle_frontend_message
 
-                if message:
-                    await session_manager.handle_frontend_message(message)
+        while True:
+            # Receive messages
+            message = parse(await receive_frame(recv))
+
+            if message:
+                await dispatch(message)
+
+    except WebSocketDisconnect:
+        logger.debug("Frontend WebSocket disconnected")
+    except Exception as e:
+        logger.error("Error in frontend WebSocket handler: %s", e)
+    finally:
+        connection_manager.disconnect(websocket)
 
-        except WebSocketDisconnect:
-            logger.info("Frontend WebSocket disconnected")
-        except Exception as e:
-            logger.error(f"Error in frontend WebSocket handler: {e}")
-        finally:
-            connection_manager.disconnect(websocket)
 
-    @staticmethod
-    def _parse_message(data: str) -> Dict[str, Any] | None:
-        """
-        Parse WebSocket message
+async def _receive_messages(websocket: WebSocket, queue: asyncio.Queue):
+    """
+    Read and parse frames from a WebSocket into a queue
+    
+    Args:
+        websocket: WebSocket connection to read from
+        queue: Bounded queue of parsed messages
+    """
+    # Bind per-frame lookups to locals outside the loop
+    recv = websocket.receive
+    receive_frame = _receive_frame
+    parse = _parse_message
+    put = queue.put
+
+    while True:
+        message = parse(await receive_frame(recv))
+
+        if message:
+            await put(message)
+
+
+async def _dispatch_messages(dispatch, queue: asyncio.Queue):
+    """
+    Dispatch queued messages in order
+    
+    Args:
+        dispatch: Coroutine function handling one message
+        queue: Bounded queue of parsed messages
+    """
+    get = queue.get
+    get_nowait = queue.get_nowait
+
+    while True:
+        await dispatch(await get())
+        # Drain frames that arrived during dispatch without waiting on the queue again
+        while queue.qsize():
+            await dispatch(get_nowait())
+
+
+async def _receive_frame(receive) -> str | bytes:
+    """
+    Receive one frame payload as delivered by the ASGI server
+    
+    Args:
+        receive: Bound WebSocket.receive of the connection
         
-        Args:
-            data: JSON string message
-            
-        Returns:
-            Parsed message dictionary, returns None if parsing fails
-        """
-        try:
-            return json.loads(data)
-        except json.JSONDecodeError as e:
-            logger.error(f"Failed to parse WebSocket message: {e}")
-            return None
+    Returns:
+        Text or binary payload of the frame, without re-encoding
+    """
+    message = await receive()
+    if message["type"] == "websocket.disconnect":
+        raise WebSocketDisconnect(message.get("code", 1000), message.get("reason"))
+    text = message.get("text")
+    return text if text is not None else message["bytes"]
 
 
-# Global WebSocket handler instance
-websocket_handler = WebSocketHandler()
+def _parse_message(data: str | bytes) -> Dict[str, Any] | None:
+    """
+    Parse WebSocket message
+    
+    Args:
+        data: JSON message (str or bytes)
+        
+    Returns:
+        Parsed message dictionary, returns None if parsing fails
+    """
+    # Every Twilio and frontend message is a JSON object; reject anything else
+    # before entering the parser
+    first = data[:1]
+    if first != "{" and first != b"{":
+        logger.error("Ignoring non-object WebSocket message: %.40r", data)
+        return None
+
+    try:
+        return _loads(data)
+    except orjson.JSONDecodeError as e:
+        logger.error("Failed to parse WebSocket message: %s", e)
+        return None
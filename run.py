@@ -3,7 +3,7 @@
 Twilio OpenAI Realtime API Server startup script
 """
 import uvicorn
-from app.config import settings
+from app.config import settings, UVICORN_LOOP
 
 if __name__ == "__main__":
     print("🚀 Starting Twilio OpenAI Realtime API Server...")
@@ -16,6 +16,9 @@ if __name__ == "__main__":
         "app.main:app",  # Use import string instead of app object
         host="0.0.0.0",
         port=settings.port,
-        reload=True,
+        reload=settings.debug,
+        workers=1 if settings.debug else settings.workers,
+        loop=UVICORN_LOOP,
+        http="httptools",
         log_level="info"
     ) 
\ No newline at end of file
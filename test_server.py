@@ -4,80 +4,87 @@ Simple server testing script
 Verify that all components are working properly
 """
 import asyncio
-import json
 import aiohttp
+import orjson
 from urllib.parse import urlparse
 
-async def test_server(base_url: str = "http://localhost:8081"):
+# Fixed test payload serialized once; sent as a text frame like the browser frontend
+TEST_FRAME = orjson.dumps({"type": "test", "message": "Hello from test script"}).decode("utf-8")
+
+async def probe_root(session: aiohttp.ClientSession, base_url: str):
+    """Probe root endpoint"""
+    async with session.get(f"{base_url}/") as response:
+        if response.status != 200:
+            return "Root", False, [f"status {response.status}"]
+        data = await response.json()
+        return "Root", True, [f"Response: {data}"]
+
+async def probe_public_url(session: aiohttp.ClientSession, base_url: str):
+    """Probe public-url endpoint"""
+    async with session.get(f"{base_url}/public-url") as response:
+        if response.status != 200:
+            return "public-url", False, [f"status {response.status}"]
+        data = await response.json()
+        return "public-url", True, [f"Public URL: {data.get('publicUrl')}"]
+
+async def probe_tools(session: aiohttp.ClientSession, base_url: str):
+    """Probe tools endpoint"""
+    async with session.get(f"{base_url}/tools") as response:
+        if response.status != 200:
+            return "tools", False, [f"status {response.status}"]
+        data = await response.json()
+        tools = data.get('tools', [])
+        detail = [f"Available tools count: {len(tools)}"]
+        detail.extend(f"- {tool.get('name')}: {tool.get('description')}" for tool in tools)
+        return "tools", True, detail
+
+TWIML_MARKER_TAIL = len(b"Connect") - 1
+
+async def probe_twiml(session: aiohttp.ClientSession, base_url: str):
+    """Probe TwiML endpoint"""
+    async with session.get(f"{base_url}/twiml") as response:
+        if response.status != 200:
+            return "TwiML", False, [f"status {response.status}"]
+        # Scan the body as it streams and stop once both markers are seen;
+        # keep a short tail so markers split across chunks still match
+        pending = {b"Connect", b"Stream"}
+        tail = b""
+        async for chunk in response.content.iter_chunked(1024):
+            window = tail + chunk
+            pending = {marker for marker in pending if marker not in window}
+            if not pending:
+                break
+            tail = window[-TWIML_MARKER_TAIL:]
+        if not pending:
+            return "TwiML", True, ["TwiML format correct"]
+        return "TwiML", True, ["⚠️  TwiML format may have issues"]
+
+PROBES = (probe_root, probe_public_url, probe_tools, probe_twiml)
+
+async def test_server(session: aiohttp.ClientSession, base_url: str = "http://localhost:8081"):
     """Test basic server functionality"""
     
     print(f"🧪 Testing server: {base_url}")
     print("=" * 50)
     
-    async with aiohttp.ClientSession() as session:
-        
-        # Test root endpoint
-        try:
-            async with session.get(f"{base_url}/") as response:
-                if response.status == 200:
-                    data = await response.json()
-                    print("✅ Root endpoint OK")
-                    print(f"   Response: {data}")
-                else:
-                    print(f"❌ Root endpoint error: {response.status}")
-        except Exception as e:
-            print(f"❌ Root endpoint exception: {e}")
-        
-        # Test public-url endpoint
-        try:
-            async with session.get(f"{base_url}/public-url") as response:
-                if response.status == 200:
-                    data = await response.json()
-                    print("✅ public-url endpoint OK")
-                    print(f"   Public URL: {data.get('publicUrl')}")
-                else:
-                    print(f"❌ public-url endpoint error: {response.status}")
-        except Exception as e:
-            print(f"❌ public-url endpoint exception: {e}")
-        
-        # Test tools endpoint
-        try:
-            async with session.get(f"{base_url}/tools") as response:
-                if response.status == 200:
-                    data = await response.json()
-                    print("✅ tools endpoint OK")
-                    tools = data.get('tools', [])
-                    print(f"   Available tools count: {len(tools)}")
-                    for tool in tools:
-                        print(f"   - {tool.get('name')}: {tool.get('description')}")
-                else:
-                    print(f"❌ tools endpoint error: {response.status}")
-        except Exception as e:
-            print(f"❌ tools endpoint exception: {e}")
-        
-        # Test TwiML endpoint
-        try:
-            async with session.get(f"{base_url}/twiml") as response:
-                if response.status == 200:
-                    content = await response.text()
-                    print("✅ TwiML endpoint OK")
-                    if "Connect" in content and "Stream" in content:
-                        print("   TwiML format correct")
-                    else:
-                        print("   ⚠️  TwiML format may have issues")
-                else:
-                    print(f"❌ TwiML endpoint error: {response.status}")
-        except Exception as e:
-            print(f"❌ TwiML endpoint exception: {e}")
+    # Endpoints are independent, so probe them concurrently
+    results = await asyncio.gather(
+        *(probe(session, base_url) for probe in PROBES), return_exceptions=True
+    )
+    
+    for probe, result in zip(PROBES, results):
+        if isinstance(result, BaseException):
+            print(f"❌ {probe.__name__} exception: {result}")
+            continue
+        name, ok, detail = result
+        if ok:
+            print(f"✅ {name} endpoint OK")
+        else:
+            print(f"❌ {name} endpoint error: {detail[0]}")
+            continue
+        for line in detail:
+            print(f"   {line}")
     
-    print("=" * 50)
-    print("🎉 Testing completed!")
-    print("\n📝 Next steps:")
-    print("1. Ensure correct environment variables are set (OPENAI_API_KEY, PUBLIC_URL)")
-    print("2. Use 'ngrok http 8081' to expose service to public internet")
-    print("3. Configure Webhook URL in Twilio Console")
-    print("4. Call Twilio phone number for testing")
-
 async def test_websocket(ws_url: str = "ws://localhost:8081/ws/logs"):
     """Test WebSocket connection"""
     try:
@@ -88,8 +95,7 @@ async def test_websocket(ws_url: str = "ws://localhost:8081/ws/logs"):
             print("✅ WebSocket connection successful")
             
             # Send test message
-            test_message = {"type": "test", "message": "Hello from test script"}
-            await websocket.send(json.dumps(test_message))
+            await websocket.send(TEST_FRAME)
             print("✅ Message sent successfully")
             
     except ImportError:
@@ -97,6 +103,22 @@ async def test_websocket(ws_url: str = "ws://localhost:8081/ws/logs"):
     except Exception as e:
         print(f"❌ WebSocket test failed: {e}")
 
+async def main(base_url: str = "http://localhost:8081"):
+    """Run all tests on one event loop with a shared HTTP session"""
+    # One keep-alive connection per concurrent probe; aiohttp already sets TCP_NODELAY
+    connector = aiohttp.TCPConnector(limit=len(PROBES), ttl_dns_cache=300, enable_cleanup_closed=True)
+    async with aiohttp.ClientSession(connector=connector) as session:
+        await test_server(session, base_url)
+    await test_websocket()
+    
+    print("=" * 50)
+    print("🎉 Testing completed!")
+    print("\n📝 Next steps:")
+    print("1. Ensure correct environment variables are set (OPENAI_API_KEY, PUBLIC_URL)")
+    print("2. Use 'ngrok http 8081' to expose service to public internet")
+    print("3. Configure Webhook URL in Twilio Console")
+    print("4. Call Twilio phone number for testing")
+
 if __name__ == "__main__":
     import sys
     
@@ -104,5 +126,4 @@ if __name__ == "__main__":
     if len(sys.argv) > 1:
         base_url = sys.argv[1]
     
-    asyncio.run(test_server(base_url))
-    asyncio.run(test_websocket()) 
\ No newline at end of file
+    asyncio.run(main(base_url)) 
\ No newline at end of file